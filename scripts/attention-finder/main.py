@@ -4,30 +4,99 @@ LinuxConfig.org - Attention Finder
 Identifies articles outside top 30 that need attention
 Prioritizes by potential impact and provides actionable recommendations
 """
+import argparse
+import csv
 import os
 import sys
+import traceback
 from datetime import datetime, date
-from tabulate import tabulate
 
 # Add parent directory to path for shared imports
 sys.path.insert(0, '/app')
 
+from shared.lib.cache import NO_CACHE_ENV
 from shared.lib.db import DatabaseConnection, execute_query, execute_insert
 from shared.lib.wp import get_post_metadata, extract_post_name_from_path
 from shared.lib.google_apis import (
-    get_analytics_data,
-    get_search_console_data,
+    get_google_data,
     calculate_composite_score
 )
 
 
+# Historical defaults for articles absent from the previous snapshot
+NO_HISTORY = {'old_pageviews': 0, 'old_position': 999, 'was_top_30': False}
+
+# Issue and recommended action text per scoring finding
+FINDINGS = {
+    'missing_keyword': (
+        "Missing focus keyword",
+        "Add focus keyword in Yoast SEO"),
+    'outdated_year': (
+        "Not updated in {0} days",
+        "Content refresh urgently needed - article over 1 year old"),
+    'outdated_half_year': (
+        "Not updated in {0} days",
+        "Schedule content update - approaching 6 months"),
+    'position_near_top': (
+        "Position {0:.1f} - near page 1 top",
+        "Quick push to top 3 positions - optimize title and add internal links"),
+    'position_page_2': (
+        "Position {0:.1f} - page 2",
+        "Target page 1 - improve content depth and backlinks"),
+    'position_page_3': (
+        "Position {0:.1f}",
+        "Long-term optimization - expand content and target related keywords"),
+    'high_impressions_low_ctr': (
+        "{0} impressions but {1:.1f}% CTR",
+        "Improve title and meta description - high visibility, low clicks"),
+    'good_impressions_low_ctr': (
+        "{0} impressions, {1:.1f}% CTR",
+        "Optimize title for better CTR - good impressions, needs improvement"),
+    'dropped_from_top_30': (
+        "Was in top 30, now dropped",
+        "Priority recovery - proven winner that declined"),
+    'traffic_collapse': (
+        "Traffic declined {0:.0f}%",
+        "Investigate decline - lost {0:.0f}% traffic"),
+    'traffic_decline': (
+        "Traffic declined {0:.0f}%",
+        "Monitor closely - showing traffic decline"),
+    'traffic_growth': (
+        "Traffic growing {0:.0f}%",
+        "Capitalize on growth - optimize to accelerate"),
+    'position_improving': (
+        "Position improving (was {0:.0f})",
+        "Momentum detected - continue optimization"),
+    'position_declining': (
+        "Position declining (was {0:.0f})",
+        "Stop the decline - investigate ranking drop"),
+    'low_readability': (
+        "Low readability ({0})",
+        "Improve readability - simplify content structure"),
+}
+
+# Fixed layout for the high priority table: Score, ID, Title, Views, Clicks, Pos, Days
+HIGH_PRIORITY_FMT = "{:>5}  {:>8}  {:<40}  {:>7}  {:>7}  {:>5}  {:>5}"
+HIGH_PRIORITY_RULE = "  ".join('-' * width for width in (5, 8, 40, 7, 7, 5, 5))
+
+
+def priority_category(score):
+    """Map a priority score to its report category"""
+    if score >= 80:
+        return 'CRITICAL'
+    elif score >= 50:
+        return 'HIGH'
+    return 'MEDIUM'
+
+
 class AttentionFinder:
     """Finds and prioritizes articles needing attention"""
 
     def __init__(self):
         self.snapshot_date = date.today()
         self.run_id = None
-        self.top_30_paths = set()
+        self.top_30_paths = frozenset()
+        self.previous_snapshot = {}
         self.attention_articles = []
 
     def start_run(self):
@@ -49,30 +118,43 @@ class AttentionFinder:
             )
 
     def get_current_top_30(self):
-        """Get current top 30 articles to exclude them"""
+        """Get current top 30 articles to exclude them, plus previous snapshot"""
         print("📊 Getting current top 30 articles...")
 
+        # Latest snapshot and the latest one before today, in one pass
         with DatabaseConnection.get_toolkit_connection() as conn:
-            top_30 = execute_query(
+            rows = execute_query(
                 conn,
-                """SELECT page_path FROM core_articles_snapshots
-                   WHERE snapshot_date = (
-                       SELECT MAX(snapshot_date) FROM core_articles_snapshots
+                """WITH snaps AS (
+                       SELECT
+                           MAX(snapshot_date) AS current_snapshot,
+                           MAX(CASE WHEN snapshot_date < CURDATE()
+                               THEN snapshot_date END) AS previous_snapshot
+                       FROM core_articles_snapshots
                    )
-                   ORDER BY rank_position LIMIT 30"""
+                   SELECT
+                       s.snapshot_date = snaps.current_snapshot AS is_current,
+                       s.snapshot_date = snaps.previous_snapshot AS is_previous,
+                       s.page_path,
+                       s.ga_pageviews,
+                       s.gsc_position,
+                       s.rank_position
+                   FROM core_articles_snapshots s
+                   JOIN snaps
+                       ON s.snapshot_date IN (snaps.current_snapshot, snaps.previous_snapshot)
+                   ORDER BY s.rank_position"""
             )
 
-        self.top_30_paths = {row['page_path'] for row in top_30}
+        top_30 = [row for row in rows if row['is_current']][:30]
+        self.top_30_paths = frozenset(row['page_path'] for row in top_30)
+        self.previous_snapshot = {row['page_path']: row for row in rows if row['is_previous']}
         print(f"✓ Excluding {len(self.top_30_paths)} top articles from analysis")
 
     def fetch_all_articles(self):
         """Fetch ALL articles from Google APIs"""
-        print("\n📊 Fetching ALL articles from Google Analytics...")
-        ga_data = get_analytics_data(days=90, limit=500)  # Get more articles
+        print("\n📊 Fetching ALL articles from Google Analytics and Search Console...")
+        ga_data, sc_data = get_google_data(days=90, limit=500)  # Get more articles
         print(f"✓ Retrieved {len(ga_data)} pages from Analytics")
-
-        print("\n🔍 Fetching ALL articles from Search Console...")
-        sc_data = get_search_console_data(days=90, limit=500)
         print(f"✓ Retrieved {len(sc_data)} pages from Search Console")
 
         return ga_data, sc_data
@@ -84,33 +166,14 @@ class AttentionFinder:
         if not page_paths:
             return {}
 
-        with DatabaseConnection.get_toolkit_connection() as conn:
-            # Get data from 90 days ago (previous snapshot)
-            placeholders = ','.join(['%s'] * len(page_paths))
-            query = f"""
-                SELECT
-                    page_path,
-                    ga_pageviews,
-                    gsc_position,
-                    rank_position
-                FROM core_articles_snapshots
-                WHERE snapshot_date = (
-                    SELECT snapshot_date
-                    FROM core_articles_snapshots
-                    WHERE snapshot_date < CURDATE()
-                    ORDER BY snapshot_date DESC
-                    LIMIT 1
-                )
-                AND page_path IN ({placeholders})
-            """
-
-            results = execute_query(conn, query, tuple(page_paths))
+        # Previous snapshot was loaded alongside the top 30
+        results = [self.previous_snapshot[p] for p in page_paths if p in self.previous_snapshot]
 
         historical = {}
         for row in results:
             historical[row['page_path']] = {
-                'old_pageviews': row['ga_pageviews'],
-                'old_position': row['gsc_position'],
+                'old_pageviews': row['ga_pageviews'] or 0,
+                'old_position': 999 if row['gsc_position'] is None else row['gsc_position'],
                 'was_top_30': row['rank_position'] <= 30 if row['rank_position'] else False
             }
 
@@ -121,28 +184,28 @@ class AttentionFinder:
         """
         Calculate priority score (0-130 points)
         Higher score = more urgent attention needed
+
+        Returns the score and a list of (finding, *values) tuples; the
+        issue/action text is only rendered for reported articles, see
+        describe_findings().
         """
         score = 0
-        issues = []
-        actions = []
+        findings = []
 
         # 1. SEO FUNDAMENTALS (0-30 pts)
         if not wp_data.get('focus_keyword'):
             score -= 20
-            issues.append("Missing focus keyword")
-            actions.append("Add focus keyword in Yoast SEO")
+            findings.append(('missing_keyword',))
         else:
             score += 10
 
         days_old = wp_data.get('days_since_update', 0)
         if days_old > 365:
             score -= 15
-            issues.append(f"Not updated in {days_old} days")
-            actions.append("Content refresh urgently needed - article over 1 year old")
+            findings.append(('outdated_year', days_old))
         elif days_old > 180:
             score -= 10
-            issues.append(f"Not updated in {days_old} days")
-            actions.append("Schedule content update - approaching 6 months")
+            findings.append(('outdated_half_year', days_old))
         elif days_old < 180:
             score += 5
 
@@ -150,16 +213,13 @@ class AttentionFinder:
         position = article.get('position', 999)
         if 4 <= position <= 10:
             score += 40
-            issues.append(f"Position {position:.1f} - near page 1 top")
-            actions.append("Quick push to top 3 positions - optimize title and add internal links")
+            findings.append(('position_near_top', position))
         elif 11 <= position <= 20:
             score += 25
-            issues.append(f"Position {position:.1f} - page 2")
-            actions.append("Target page 1 - improve content depth and backlinks")
+            findings.append(('position_page_2', position))
         elif 21 <= position <= 30:
             score += 10
-            issues.append(f"Position {position:.1f}")
-            actions.append("Long-term optimization - expand content and target related keywords")
+            findings.append(('position_page_3', position))
 
         # 3. TRAFFIC POTENTIAL (0-30 pts)
         impressions = article.get('impressions', 0)
@@ -167,78 +227,73 @@ class AttentionFinder:
 
         if impressions > 10000 and ctr < 2:
             score += 30
-            issues.append(f"{impressions} impressions but {ctr:.1f}% CTR")
-            actions.append("Improve title and meta description - high visibility, low clicks")
+            findings.append(('high_impressions_low_ctr', impressions, ctr))
         elif impressions > 5000 and ctr < 2:
             score += 20
-            issues.append(f"{impressions} impressions, {ctr:.1f}% CTR")
-            actions.append("Optimize title for better CTR - good impressions, needs improvement")
+            findings.append(('good_impressions_low_ctr', impressions, ctr))
         elif impressions > 5000:
             score += 10
 
         # 4. HISTORICAL PERFORMANCE (0-20 pts)
-        if historical_data:
-            if historical_data.get('was_top_30'):
-                score += 20
-                issues.append("Was in top 30, now dropped")
-                actions.append("Priority recovery - proven winner that declined")
-
-            old_views = historical_data.get('old_pageviews', 0)
-            current_views = article.get('pageviews', 0)
-
-            if old_views > 0:
-                decline_pct = ((old_views - current_views) / old_views) * 100
-                if decline_pct > 50:
-                    score += 15
-                    issues.append(f"Traffic declined {decline_pct:.0f}%")
-                    actions.append(f"Investigate decline - lost {decline_pct:.0f}% traffic")
-                elif decline_pct > 20:
-                    score += 10
-                    issues.append(f"Traffic declined {decline_pct:.0f}%")
-                    actions.append("Monitor closely - showing traffic decline")
-                elif decline_pct < -20:  # Growing
-                    score += 5
-                    issues.append(f"Traffic growing {abs(decline_pct):.0f}%")
-                    actions.append("Capitalize on growth - optimize to accelerate")
-
-            # Position changes
-            old_pos = historical_data.get('old_position', 999)
-            if old_pos < 999 and position < 999:
-                pos_change = position - old_pos
-                if pos_change < -5:  # Improving
-                    score += 10
-                    issues.append(f"Position improving (was {old_pos:.0f})")
-                    actions.append("Momentum detected - continue optimization")
-                elif pos_change > 5:  # Declining
-                    issues.append(f"Position declining (was {old_pos:.0f})")
-                    actions.append("Stop the decline - investigate ranking drop")
+        if historical_data['was_top_30']:
+            score += 20
+            findings.append(('dropped_from_top_30',))
+
+        old_views = historical_data['old_pageviews']
+        current_views = article.get('pageviews', 0)
+
+        if old_views > 0:
+            decline_pct = ((old_views - current_views) / old_views) * 100
+            if decline_pct > 50:
+                score += 15
+                findings.append(('traffic_collapse', decline_pct))
+            elif decline_pct > 20:
+                score += 10
+                findings.append(('traffic_decline', decline_pct))
+            elif decline_pct < -20:  # Growing
+                score += 5
+                findings.append(('traffic_growth', abs(decline_pct)))
+
+        # Position changes
+        old_pos = historical_data['old_position']
+        if old_pos < 999 and position < 999:
+            pos_change = position - old_pos
+            if pos_change < -5:  # Improving
+                score += 10
+                findings.append(('position_improving', old_pos))
+            elif pos_change > 5:  # Declining
+                findings.append(('position_declining', old_pos))
 
         # 5. READABILITY (bonus/penalty)
         readability = wp_data.get('readability_score', 0)
         if readability > 0 and readability < 60:
             score -= 5
-            issues.append(f"Low readability ({readability})")
-            actions.append("Improve readability - simplify content structure")
+            findings.append(('low_readability', readability))
+
+        return max(0, score), findings
 
-        return max(0, score), issues, actions
+    @staticmethod
+    def describe_findings(findings):
+        """Render (finding, *values) tuples into issue and action strings"""
+        issues = []
+        actions = []
+        for key, *values in findings:
+            issue, action = FINDINGS[key]
+            issues.append(issue.format(*values))
+            actions.append(action.format(*values))
+        return issues, actions
 
     def analyze_articles(self, ga_data, sc_data):
         """Analyze all articles and calculate priorities"""
         print("\n🧮 Analyzing articles and calculating priority scores...")
 
-        # Combine GA and SC data
-        all_pages = set(list(ga_data.keys()) + list(sc_data.keys()))
-
-        # Exclude top 30
-        pages_to_analyze = all_pages - self.top_30_paths
+        # Combine GA and SC data, excluding top 30
+        pages_to_analyze = (ga_data.keys() | sc_data.keys()) - self.top_30_paths
         print(f"✓ Analyzing {len(pages_to_analyze)} articles (excluding top 30)")
 
         # Get post names for WordPress lookup
-        post_names = []
-        for page_path in pages_to_analyze:
-            post_name = extract_post_name_from_path(page_path)
-            if post_name:
-                post_names.append(post_name)
+        path_to_name = {p: extract_post_name_from_path(p) for p in pages_to_analyze}
+        post_names = [name for name in path_to_name.values() if name]
 
         # Fetch WordPress metadata
         print(f"📝 Fetching WordPress data for {len(post_names)} articles...")
@@ -249,13 +304,11 @@ class AttentionFinder:
 
         # Analyze each article
         analyzed = []
-        for page_path in pages_to_analyze:
-            post_name = extract_post_name_from_path(page_path)
-
+        for page_path, post_name in path_to_name.items():
             ga = ga_data.get(page_path, {})
             sc = sc_data.get(page_path, {})
             wp = wp_metadata.get(post_name, {})
-            hist = historical_data.get(page_path, {})
+            hist = historical_data.get(page_path, NO_HISTORY)
 
             # Skip if no meaningful data
             if not ga and not sc:
@@ -278,21 +331,31 @@ class AttentionFinder:
             }
 
             # Calculate priority score
-            score, issues, actions = self.calculate_priority_score(
+            score, findings = self.calculate_priority_score(
                 article_data, wp, hist
             )
 
             # Only include if score > 20 (minimum threshold)
             if score > 20:
                 article_data['priority_score'] = score
-                article_data['issues'] = issues
-                article_data['actions'] = actions
+                article_data['findings'] = findings
                 analyzed.append(article_data)
 
         # Sort by priority score
         analyzed.sort(key=lambda x: x['priority_score'], reverse=True)
 
         self.attention_articles = analyzed[:50]  # Top 50
+
+        # Render report fields only for the reported articles
+        for article in self.attention_articles:
+            article['issues'], article['actions'] = self.describe_findings(
+                article.pop('findings')
+            )
+            article['score_str'] = f"{article['priority_score']:.0f}"
+            article['category'] = priority_category(article['priority_score'])
+            article['dev_url'] = f"https://dev.linuxconfig.org{article['page_path']}"
+            article['title60'] = (article['post_title'] or 'Unknown')[:60]
+            article['title40'] = article['title60'][:40]
         print(f"✓ Found {len(analyzed)} articles needing attention (showing top 50)")
 
         return self.attention_articles
@@ -307,10 +370,19 @@ class AttentionFinder:
             print("\n✅ No articles need urgent attention!")
             return
 
-        # Categorize by priority
-        critical = [a for a in self.attention_articles if a['priority_score'] >= 80]
-        high = [a for a in self.attention_articles if 50 <= a['priority_score'] < 80]
-        medium = [a for a in self.attention_articles if 20 <= a['priority_score'] < 50]
+        # Categorize by priority - articles are sorted by score, so split once
+        articles = self.attention_articles
+        high_start = medium_start = len(articles)
+        for i, article in enumerate(articles):
+            if article['priority_score'] < 80 and high_start == len(articles):
+                high_start = i
+            if article['priority_score'] < 50:
+                medium_start = i
+                break
+
+        critical = articles[:high_start]
+        high = articles[high_start:medium_start]
+        medium = articles[medium_start:]
 
         print(f"\nFound {len(self.attention_articles)} articles analyzed")
         print(f"  🔴 Critical: {len(critical)}")
@@ -324,9 +396,8 @@ class AttentionFinder:
             print("=" * 80)
 
             for i, article in enumerate(critical, 1):
-                dev_url = f"https://dev.linuxconfig.org{article['page_path']}"
-                print(f"\n{i}. [Score: {article['priority_score']:.0f}] ID:{article['post_id']} {article['post_title'][:60]}")
-                print(f"   URL: {dev_url}")
+                print(f"\n{i}. [Score: {article['score_str']}] ID:{article['post_id']} {article['title60']}")
+                print(f"   URL: {article['dev_url']}")
                 print(f"   Metrics: {article['pageviews']} views, {article['clicks']} clicks, Pos {article['position']:.1f}")
                 print(f"   Issues: {'; '.join(article['issues'])}")
                 print(f"   Actions:")
@@ -339,23 +410,18 @@ class AttentionFinder:
             print("🟡 HIGH PRIORITY - Next 2 Weeks")
             print("=" * 80 + "\n")
 
-            table_data = []
+            print(HIGH_PRIORITY_FMT.format('Score', 'ID', 'Title', 'Views', 'Clicks', 'Pos', 'Days'))
+            print(HIGH_PRIORITY_RULE)
             for article in high[:10]:  # Top 10 high priority
-                table_data.append([
-                    f"{article['priority_score']:.0f}",
+                print(HIGH_PRIORITY_FMT.format(
+                    article['score_str'],
                     article['post_id'] or 'N/A',
-                    article['post_title'][:40],
+                    article['title40'],
                     article['pageviews'],
                     article['clicks'],
                     f"{article['position']:.1f}",
                     article['days_since_update'] or 'N/A'
-                ])
-
-            print(tabulate(
-                table_data,
-                headers=['Score', 'ID', 'Title', 'Views', 'Clicks', 'Pos', 'Days'],
-                tablefmt='simple'
-            ))
+                ))
 
             if len(high) > 10:
                 print(f"\n   ... and {len(high) - 10} more (see CSV)")
@@ -369,11 +435,30 @@ class AttentionFinder:
 
     def save_csv_report(self):
         """Save detailed CSV report"""
-        import csv
-
         output_file = f'/app/reports/attention_needed_{self.snapshot_date}.csv'
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        rows = [
+            (
+                article['score_str'],
+                article['category'],
+                article['post_id'] or '',
+                article['post_title'],
+                article['dev_url'],
+                article['pageviews'],
+                article['clicks'],
+                article['impressions'],
+                f"{article['ctr'] * 100:.2f}",
+                f"{article['position']:.1f}",
+                article['days_since_update'],
+                article['focus_keyword'] or 'MISSING',
+                article['readability_score'],
+                '; '.join(article['issues']),
+                ' | '.join(article['actions'])
+            )
+            for article in self.attention_articles
+        ]
+
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow([
                 'Priority Score', 'Category', 'Post ID', 'Post Title', 'Dev URL',
@@ -381,36 +466,7 @@ class AttentionFinder:
                 'Avg Position', 'Days Since Update', 'Focus Keyword',
                 'Readability', 'Issues', 'Recommended Actions'
             ])
-
-            for article in self.attention_articles:
-                dev_url = f"https://dev.linuxconfig.org{article['page_path']}"
-
-                # Categorize
-                score = article['priority_score']
-                if score >= 80:
-                    category = 'CRITICAL'
-                elif score >= 50:
-                    category = 'HIGH'
-                else:
-                    category = 'MEDIUM'
-
-                writer.writerow([
-                    f"{article['priority_score']:.0f}",
-                    category,
-                    article['post_id'] or '',
-                    article['post_title'],
-                    dev_url,
-                    article['pageviews'],
-                    article['clicks'],
-                    article['impressions'],
-                    f"{article['ctr'] * 100:.2f}",
-                    f"{article['position']:.1f}",
-                    article['days_since_update'],
-                    article['focus_keyword'] or 'MISSING',
-                    article['readability_score'],
-                    '; '.join(article['issues']),
-                    ' | '.join(article['actions'])
-                ])
+            writer.writerows(rows)
 
         print(f"\n✓ CSV report saved: {output_file}")
 
@@ -436,6 +492,15 @@ class AttentionFinder:
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='LinuxConfig.org - Attention Finder')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore cached Google API results and fetch fresh data')
+    args = parser.parse_args()
+
+    if args.no_cache:
+        os.environ[NO_CACHE_ENV] = '1'
+
+    # DB steps share the process-wide toolkit connection (see DatabaseConnection)
     finder = AttentionFinder()
 
     try:
@@ -464,7 +529,6 @@ def main():
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         finder.complete_run(success=False)
         sys.exit(1)
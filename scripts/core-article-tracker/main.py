@@ -4,15 +4,23 @@ LinuxConfig.org - Enhanced Core Article Tracker
 Identifies top 30 core articles and tracks performance bi-weekly
 Combines GA, GSC, WordPress, and Yoast SEO data
 """
+import argparse
+import csv
+import heapq
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, date
+from operator import itemgetter
 from tabulate import tabulate
 
 # Add parent directory to path for shared imports
 sys.path.insert(0, '/app')
 
-from shared.lib.db import DatabaseConnection, execute_query, execute_insert
+from shared.lib.cache import NO_CACHE_ENV
+from shared.lib.db import DatabaseConnection, cursor_for, execute_insert, execute_many
 from shared.lib.wp import get_post_metadata, extract_post_name_from_path, get_post_url
 from shared.lib.google_apis import (
     get_analytics_data,
@@ -21,6 +29,30 @@ from shared.lib.google_apis import (
 )
 
 
+@dataclass(slots=True)
+class ArticleRecord:
+    """One tracked article: GA/GSC metrics merged with WordPress/Yoast data"""
+    rank: int
+    page_path: str
+    post_name: str
+    post_id: int | None
+    post_title: str
+    score: float
+    pageviews: int
+    sessions: int
+    avg_duration: float
+    clicks: int
+    impressions: int
+    ctr: float
+    position: float
+    last_modified: datetime | None
+    days_since_update: int
+    focus_keyword: str | None
+    keyword_score: int
+    readability_score: int
+    is_cornerstone: int
+
+
 class CoreArticleTracker:
     """Manages core article tracking and reporting"""
 
@@ -29,6 +61,7 @@ class CoreArticleTracker:
         self.run_id = None
         self.articles_data = []
         self.alerts = []
+        self._alerts_by_severity = ([], [], [])
 
     def start_run(self):
         """Record script run start"""
@@ -48,94 +81,116 @@ class CoreArticleTracker:
                 ('core-article-tracker', 'started')
             )
 
-    def fetch_google_data(self):
-        """Fetch data from Google Analytics and Search Console"""
-        print("📊 Fetching Google Analytics data...")
-        ga_data = get_analytics_data(days=90, limit=100)
-        print(f"✓ Retrieved {len(ga_data)} pages from Analytics")
+    def fetch_source_data(self, top_n=30):
+        """
+        Fetch Google Analytics and Search Console data, and speculatively
+        fetch WordPress metadata for the top N pages by GA pageviews
+
+        The WordPress lookup starts as soon as GA returns, so it overlaps
+        the Search Console call. Returns (ga_data, sc_data, wp_metadata),
+        where wp_metadata maps every prefetched post name to its metadata
+        or None if WordPress has no such post.
+        """
+        print("📊 Fetching Google Analytics and Search Console data...")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ga_future = executor.submit(get_analytics_data, 90, 100)
+            sc_future = executor.submit(get_search_console_data, 90, 100)
+
+            ga_data = ga_future.result()
+            wp_future = executor.submit(self.prefetch_wordpress_data, ga_data, top_n)
 
-        print("\n🔍 Fetching Search Console data...")
-        sc_data = get_search_console_data(days=90, limit=100)
+            sc_data = sc_future.result()
+            wp_metadata = wp_future.result()
+
+        print(f"✓ Retrieved {len(ga_data)} pages from Analytics")
         print(f"✓ Retrieved {len(sc_data)} pages from Search Console")
 
-        return ga_data, sc_data
+        return ga_data, sc_data, wp_metadata
 
-    def combine_and_score(self, ga_data, sc_data):
-        """Combine GA and GSC data, calculate scores"""
-        print("\n🧮 Calculating composite scores...")
+    @staticmethod
+    def prefetch_wordpress_data(ga_data, top_n):
+        """Fetch WordPress metadata for the top N GA pages by pageviews"""
+        top_pages = heapq.nlargest(top_n, ga_data.items(), key=lambda x: x[1]['pageviews'])
+        post_names = [
+            name for name in (extract_post_name_from_path(page) for page, _ in top_pages) if name
+        ]
+        if not post_names:
+            return {}
 
-        combined = {}
-        all_pages = set(list(ga_data.keys()) + list(sc_data.keys()))
+        metadata = get_post_metadata(post_names)
+        return {name: metadata.get(name) for name in post_names}
 
-        for page in all_pages:
+    def combine_and_score(self, ga_data, sc_data, top_n=30):
+        """Combine GA and GSC data, calculate scores, keep the top N"""
+        print("\n🧮 Calculating composite scores...")
+
+        # Keep (page_path, score, ga, sc) tuples; article dicts are built for the top N only
+        scored = []
+        for page in ga_data.keys() | sc_data.keys():
             ga = ga_data.get(page, {})
             sc = sc_data.get(page, {})
+            scored.append((page, calculate_composite_score(ga, sc), ga, sc))
 
-            score = calculate_composite_score(ga, sc)
-
-            combined[page] = {
-                'page_path': page,
-                'score': score,
-                'pageviews': ga.get('pageviews', 0),
-                'sessions': ga.get('sessions', 0),
-                'avg_duration': ga.get('avg_duration', 0),
-                'clicks': sc.get('clicks', 0),
-                'impressions': sc.get('impressions', 0),
-                'ctr': sc.get('ctr', 0),
-                'position': sc.get('position', 0)
-            }
-
-        # Sort by score
-        sorted_articles = sorted(combined.items(), key=lambda x: x[1]['score'], reverse=True)
-        print(f"✓ Scored {len(sorted_articles)} total pages")
+        # Only the top N are used downstream, so skip sorting the rest
+        sorted_articles = heapq.nlargest(top_n, scored, key=itemgetter(1))
+        print(f"✓ Scored {len(scored)} total pages")
 
         return sorted_articles
 
-    def enrich_with_wordpress_data(self, sorted_articles, top_n=30):
-        """Add WordPress and Yoast data to top articles"""
+    def enrich_with_wordpress_data(self, sorted_articles, top_n=30, wp_metadata=None):
+        """
+        Add WordPress and Yoast data to top articles
+
+        wp_metadata holds prefetched post metadata (see fetch_source_data);
+        only post names missing from it are looked up.
+        """
         print(f"\n📝 Fetching WordPress data for top {top_n} articles...")
 
         # Get top N articles
         top_articles = sorted_articles[:top_n]
 
         # Extract post names from page paths
-        post_names = []
-        for page_path, _ in top_articles:
-            post_name = extract_post_name_from_path(page_path)
-            if post_name:
-                post_names.append(post_name)
-
-        # Fetch WordPress metadata
-        wp_metadata = get_post_metadata(post_names)
-        print(f"✓ Retrieved metadata for {len(wp_metadata)} posts")
+        post_names_by_path = [
+            extract_post_name_from_path(page_path) for page_path, *_ in top_articles
+        ]
+        post_names = [name for name in post_names_by_path if name]
+
+        # Fetch WordPress metadata not covered by the prefetch
+        wp_metadata = dict(wp_metadata or {})
+        missing = [name for name in post_names if name not in wp_metadata]
+        if missing:
+            wp_metadata.update(get_post_metadata(missing))
+        found = sum(1 for name in set(post_names) if wp_metadata.get(name))
+        print(f"✓ Retrieved metadata for {found} posts ({len(missing)} outside prefetch)")
 
         # Combine data
         enriched = []
-        for rank, (page_path, metrics) in enumerate(top_articles, 1):
-            post_name = extract_post_name_from_path(page_path)
-            wp_data = wp_metadata.get(post_name, {})
-
-            article = {
-                'rank': rank,
-                'page_path': page_path,
-                'post_name': post_name,
-                'post_id': wp_data.get('post_id'),
-                'post_title': wp_data.get('post_title', ''),
-                'score': metrics['score'],
-                'pageviews': metrics['pageviews'],
-                'sessions': metrics['sessions'],
-                'avg_duration': metrics['avg_duration'],
-                'clicks': metrics['clicks'],
-                'impressions': metrics['impressions'],
-                'ctr': metrics['ctr'],
-                'position': metrics['position'],
-                'last_modified': wp_data.get('post_modified'),
-                'days_since_update': wp_data.get('days_since_update', 0),
-                'focus_keyword': wp_data.get('focus_keyword'),
-                'keyword_score': wp_data.get('keyword_score', 0),
-                'readability_score': wp_data.get('readability_score', 0),
-                'is_cornerstone': wp_data.get('is_cornerstone', 0)
-            }
+        for rank, ((page_path, score, ga, sc), post_name) in enumerate(
+                zip(top_articles, post_names_by_path), 1):
+            wp_data = wp_metadata.get(post_name) or {}
+
+            article = ArticleRecord(
+                rank=rank,
+                page_path=page_path,
+                post_name=post_name,
+                post_id=wp_data.get('post_id'),
+                post_title=wp_data.get('post_title', ''),
+                score=score,
+                pageviews=ga.get('pageviews', 0),
+                sessions=ga.get('sessions', 0),
+                avg_duration=ga.get('avg_duration', 0),
+                clicks=sc.get('clicks', 0),
+                impressions=sc.get('impressions', 0),
+                ctr=sc.get('ctr', 0),
+                position=sc.get('position', 0),
+                last_modified=wp_data.get('post_modified'),
+                days_since_update=wp_data.get('days_since_update', 0),
+                focus_keyword=wp_data.get('focus_keyword'),
+                keyword_score=wp_data.get('keyword_score', 0),
+                readability_score=wp_data.get('readability_score', 0),
+                is_cornerstone=wp_data.get('is_cornerstone', 0)
+            )
 
             enriched.append(article)
 
@@ -143,110 +198,134 @@ class CoreArticleTracker:
         return enriched
 
     def generate_alerts(self):
-        """Generate alerts based on article data and historical trends"""
-        print("\n⚠️  Generating alerts...")
+        """
+        Generate alerts based on article data and historical trends
 
-        with DatabaseConnection.get_toolkit_connection() as conn:
-            # Get previous snapshot for comparison
-            previous_snapshot = execute_query(
-                conn,
-                """SELECT snapshot_date FROM core_articles_snapshots
-                   WHERE snapshot_date < %s
-                   ORDER BY snapshot_date DESC LIMIT 1""",
-                (self.snapshot_date,)
-            )
-
-            has_history = len(previous_snapshot) > 0
+        Historical alerts compare the saved snapshot against the previous one
+        in SQL, so this must run after save_snapshot().
+        """
+        print("\n⚠️  Generating alerts...")
 
-            for article in self.articles_data:
-                page_path = article['page_path']
+        # Bucket by severity as alerts are raised so reports need no re-filtering
+        critical, warning, info = [], [], []
+        add_critical, add_warning, add_info = critical.append, warning.append, info.append
 
-                # Alert: Missing focus keyword
-                if not article['focus_keyword']:
-                    self.alerts.append({
+        for article in self.articles_data:
+            page_path = article.page_path
+
+            # Alert: Missing focus keyword
+            if not article.focus_keyword:
+                add_warning({
+                    'page_path': page_path,
+                    'type': 'missing_focus_keyword',
+                    'severity': 'warning',
+                    'message': 'Article has no focus keyword set',
+                    'value': 'NULL'
+                })
+
+            # Alert: Not updated in 6+ months
+            if article.days_since_update and article.days_since_update >= 180:
+                severity = 'critical' if article.days_since_update >= 365 else 'warning'
+                alert = {
+                    'page_path': page_path,
+                    'type': 'content_outdated',
+                    'severity': severity,
+                    'message': f'Not updated in {article.days_since_update} days',
+                    'value': str(article.days_since_update)
+                }
+                if severity == 'critical':
+                    add_critical(alert)
+                else:
+                    add_warning(alert)
+
+            # Alert: Low readability
+            if article.readability_score and article.readability_score < 60:
+                add_info({
+                    'page_path': page_path,
+                    'type': 'low_readability',
+                    'severity': 'info',
+                    'message': f'Low readability score: {article.readability_score}',
+                    'value': str(article.readability_score)
+                })
+
+            # Alert: Poor ranking position
+            if article.position and article.position > 20:
+                add_warning({
+                    'page_path': page_path,
+                    'type': 'poor_ranking',
+                    'severity': 'warning',
+                    'message': f'Average position: {article.position:.1f}',
+                    'value': f'{article.position:.1f}'
+                })
+
+        # Historical comparison alerts: only pages past a threshold come back
+        with DatabaseConnection.get_toolkit_connection() as conn, cursor_for(conn) as cursor:
+            cursor.execute(
+                """SELECT
+                       c.page_path,
+                       c.rank_position, p.rank_position AS prev_rank,
+                       c.gsc_position, p.gsc_position AS prev_position,
+                       c.ga_pageviews, p.ga_pageviews AS prev_pageviews
+                   FROM core_articles_snapshots c
+                   JOIN core_articles_snapshots p
+                       ON p.page_path = c.page_path
+                       AND p.snapshot_date = (
+                           SELECT MAX(snapshot_date) FROM core_articles_snapshots
+                           WHERE snapshot_date < %s
+                       )
+                   WHERE c.snapshot_date = %s
+                       AND (c.rank_position > p.rank_position + 5
+                            OR (c.gsc_position > 0 AND p.gsc_position > 0
+                                AND c.gsc_position > p.gsc_position + 5)
+                            OR (p.ga_pageviews > 0
+                                AND c.ga_pageviews < p.ga_pageviews * 0.8))
+                   ORDER BY c.rank_position""",
+                (self.snapshot_date, self.snapshot_date)
+            )
+            changes = cursor.fetchall()
+
+        current_paths = {article.page_path for article in self.articles_data}
+        for (page_path, rank, prev_rank, position, prev_position,
+                pageviews, prev_pageviews) in changes:
+            if page_path not in current_paths:
+                continue
+
+            # Rank dropped
+            if prev_rank and rank > prev_rank + 5:
+                add_warning({
+                    'page_path': page_path,
+                    'type': 'rank_declined',
+                    'severity': 'warning',
+                    'message': f'Rank dropped from {prev_rank} to {rank}',
+                    'value': f'{prev_rank} → {rank}'
+                })
+
+            # Position worsened
+            if prev_position and position:
+                position_change = position - prev_position
+                if position_change > 5:
+                    add_warning({
                         'page_path': page_path,
-                        'type': 'missing_focus_keyword',
+                        'type': 'position_declined',
                         'severity': 'warning',
-                        'message': 'Article has no focus keyword set',
-                        'value': 'NULL'
-                    })
-
-                # Alert: Not updated in 6+ months
-                if article['days_since_update'] and article['days_since_update'] >= 180:
-                    self.alerts.append({
-                        'page_path': page_path,
-                        'type': 'content_outdated',
-                        'severity': 'critical' if article['days_since_update'] >= 365 else 'warning',
-                        'message': f'Not updated in {article["days_since_update"]} days',
-                        'value': str(article['days_since_update'])
-                    })
-
-                # Alert: Low readability
-                if article['readability_score'] and article['readability_score'] < 60:
-                    self.alerts.append({
-                        'page_path': page_path,
-                        'type': 'low_readability',
-                        'severity': 'info',
-                        'message': f'Low readability score: {article["readability_score"]}',
-                        'value': str(article['readability_score'])
+                        'message': f'Search position worsened by {position_change:.1f}',
+                        'value': f'{prev_position:.1f} → {position:.1f}'
                     })
 
-                # Alert: Poor ranking position
-                if article['position'] and article['position'] > 20:
-                    self.alerts.append({
+            # Traffic declined significantly
+            if prev_pageviews:
+                traffic_change = ((pageviews - prev_pageviews) / prev_pageviews) * 100
+                if traffic_change < -20:
+                    add_warning({
                         'page_path': page_path,
-                        'type': 'poor_ranking',
+                        'type': 'traffic_declined',
                         'severity': 'warning',
-                        'message': f'Average position: {article["position"]:.1f}',
-                        'value': f'{article["position"]:.1f}'
+                        'message': f'Traffic down {abs(traffic_change):.1f}%',
+                        'value': f'{traffic_change:.1f}%'
                     })
 
-                # Historical comparison alerts (if previous snapshot exists)
-                if has_history:
-                    prev_data = execute_query(
-                        conn,
-                        """SELECT rank_position, gsc_position, ga_pageviews
-                           FROM core_articles_snapshots
-                           WHERE snapshot_date = %s AND page_path = %s""",
-                        (previous_snapshot[0]['snapshot_date'], page_path)
-                    )
-
-                    if prev_data:
-                        prev = prev_data[0]
-
-                        # Rank dropped
-                        if prev['rank_position'] and article['rank'] > prev['rank_position'] + 5:
-                            self.alerts.append({
-                                'page_path': page_path,
-                                'type': 'rank_declined',
-                                'severity': 'warning',
-                                'message': f'Rank dropped from {prev["rank_position"]} to {article["rank"]}',
-                                'value': f'{prev["rank_position"]} → {article["rank"]}'
-                            })
-
-                        # Position worsened
-                        if prev['gsc_position'] and article['position']:
-                            position_change = article['position'] - prev['gsc_position']
-                            if position_change > 5:
-                                self.alerts.append({
-                                    'page_path': page_path,
-                                    'type': 'position_declined',
-                                    'severity': 'warning',
-                                    'message': f'Search position worsened by {position_change:.1f}',
-                                    'value': f'{prev["gsc_position"]:.1f} → {article["position"]:.1f}'
-                                })
-
-                        # Traffic declined significantly
-                        if prev['ga_pageviews']:
-                            traffic_change = ((article['pageviews'] - prev['ga_pageviews']) / prev['ga_pageviews']) * 100
-                            if traffic_change < -20:
-                                self.alerts.append({
-                                    'page_path': page_path,
-                                    'type': 'traffic_declined',
-                                    'severity': 'warning',
-                                    'message': f'Traffic down {abs(traffic_change):.1f}%',
-                                    'value': f'{traffic_change:.1f}%'
-                                })
+        self.alerts = critical + warning + info
+        self._alerts_by_severity = (critical, warning, info)
 
         print(f"✓ Generated {len(self.alerts)} alerts")
         return self.alerts
@@ -256,34 +335,37 @@ class CoreArticleTracker:
         print(f"\n💾 Saving snapshot to database...")
 
         with DatabaseConnection.get_toolkit_connection() as conn:
-            for article in self.articles_data:
-                execute_insert(
-                    conn,
-                    """INSERT INTO core_articles_snapshots
-                       (snapshot_date, page_path, post_name, post_id,
-                        ga_pageviews, ga_sessions, ga_avg_duration,
-                        gsc_clicks, gsc_impressions, gsc_ctr, gsc_position,
-                        wp_last_modified, wp_days_since_update,
-                        yoast_focus_keyword, yoast_keyword_score,
-                        yoast_readability_score, yoast_is_cornerstone,
-                        composite_score, rank_position)
-                       VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                               %s, %s, %s, %s, %s, %s, %s, %s)
-                       ON DUPLICATE KEY UPDATE
-                        ga_pageviews = VALUES(ga_pageviews),
-                        gsc_clicks = VALUES(gsc_clicks),
-                        composite_score = VALUES(composite_score),
-                        rank_position = VALUES(rank_position)""",
+            execute_many(
+                conn,
+                """INSERT INTO core_articles_snapshots
+                   (snapshot_date, page_path, post_name, post_id,
+                    ga_pageviews, ga_sessions, ga_avg_duration,
+                    gsc_clicks, gsc_impressions, gsc_ctr, gsc_position,
+                    wp_last_modified, wp_days_since_update,
+                    yoast_focus_keyword, yoast_keyword_score,
+                    yoast_readability_score, yoast_is_cornerstone,
+                    composite_score, rank_position)
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                           %s, %s, %s, %s, %s, %s, %s, %s)
+                   ON DUPLICATE KEY UPDATE
+                    ga_pageviews = VALUES(ga_pageviews),
+                    gsc_clicks = VALUES(gsc_clicks),
+                    gsc_position = VALUES(gsc_position),
+                    composite_score = VALUES(composite_score),
+                    rank_position = VALUES(rank_position)""",
+                [
                     (
-                        self.snapshot_date, article['page_path'], article['post_name'],
-                        article['post_id'], article['pageviews'], article['sessions'],
-                        article['avg_duration'], article['clicks'], article['impressions'],
-                        article['ctr'], article['position'], article['last_modified'],
-                        article['days_since_update'], article['focus_keyword'],
-                        article['keyword_score'], article['readability_score'],
-                        article['is_cornerstone'], article['score'], article['rank']
+                        self.snapshot_date, article.page_path, article.post_name,
+                        article.post_id, article.pageviews, article.sessions,
+                        article.avg_duration, article.clicks, article.impressions,
+                        article.ctr, article.position, article.last_modified,
+                        article.days_since_update, article.focus_keyword,
+                        article.keyword_score, article.readability_score,
+                        article.is_cornerstone, article.score, article.rank
                     )
-                )
+                    for article in self.articles_data
+                ]
+            )
 
         print(f"✓ Saved {len(self.articles_data)} articles")
 
@@ -295,18 +377,20 @@ class CoreArticleTracker:
         print(f"💾 Saving {len(self.alerts)} alerts...")
 
         with DatabaseConnection.get_toolkit_connection() as conn:
-            for alert in self.alerts:
-                execute_insert(
-                    conn,
-                    """INSERT INTO core_articles_alerts
-                       (snapshot_date, page_path, alert_type, alert_severity,
-                        alert_message, metric_value)
-                       VALUES (%s, %s, %s, %s, %s, %s)""",
+            execute_many(
+                conn,
+                """INSERT INTO core_articles_alerts
+                   (snapshot_date, page_path, alert_type, alert_severity,
+                    alert_message, metric_value)
+                   VALUES (%s, %s, %s, %s, %s, %s)""",
+                [
                     (
                         self.snapshot_date, alert['page_path'], alert['type'],
                         alert['severity'], alert['message'], alert['value']
                     )
-                )
+                    for alert in self.alerts
+                ]
+            )
 
         print(f"✓ Saved alerts")
 
@@ -322,18 +406,18 @@ class CoreArticleTracker:
         table_data = []
         for article in self.articles_data:
             # Generate dev URL (full, no truncation)
-            dev_url = f"https://dev.linuxconfig.org{article['page_path']}" if article['page_path'] else 'N/A'
+            dev_url = f"https://dev.linuxconfig.org{article.page_path}" if article.page_path else 'N/A'
 
             table_data.append([
-                article['rank'],
-                article['post_id'] or 'N/A',
-                article['post_title'][:50] if article['post_title'] else 'N/A',
+                article.rank,
+                article.post_id or 'N/A',
+                article.post_title[:50] if article.post_title else 'N/A',
                 dev_url,  # Full URL, no truncation
-                f"{article['score']:.0f}",
-                article['pageviews'],
-                article['clicks'],
-                f"{article['position']:.1f}",
-                article['days_since_update'] or 'N/A'
+                f"{article.score:.0f}",
+                article.pageviews,
+                article.clicks,
+                f"{article.position:.1f}",
+                article.days_since_update or 'N/A'
             ])
 
         print(tabulate(
@@ -346,10 +430,7 @@ class CoreArticleTracker:
         if self.alerts:
             print(f"\n⚠️  ALERTS SUMMARY ({len(self.alerts)} total):\n")
 
-            # Group by severity
-            critical = [a for a in self.alerts if a['severity'] == 'critical']
-            warning = [a for a in self.alerts if a['severity'] == 'warning']
-            info = [a for a in self.alerts if a['severity'] == 'info']
+            critical, warning, info = self._alerts_by_severity
 
             if critical:
                 print(f"🔴 CRITICAL ({len(critical)}):")
@@ -369,13 +450,41 @@ class CoreArticleTracker:
         # Save CSV
         self.save_csv_report()
 
+    @staticmethod
+    def csv_row(article, article_alerts):
+        """Build the CSV report row for one article"""
+        return (
+            article.rank,
+            article.page_path,
+            article.post_title,
+            get_post_url(article.post_name) if article.post_name else '',
+            f"{article.score:.2f}",
+            article.pageviews,
+            article.sessions,
+            article.clicks,
+            article.impressions,
+            f"{article.position:.1f}",
+            f"{article.ctr:.4f}",
+            f"{article.avg_duration:.1f}",
+            article.last_modified,
+            article.days_since_update,
+            article.focus_keyword or '',
+            article.keyword_score,
+            article.readability_score,
+            'Yes' if article.is_cornerstone else 'No',
+            '; '.join(article_alerts)
+        )
+
     def save_csv_report(self):
         """Save detailed CSV report"""
-        import csv
-
         output_file = f'/app/reports/core_articles_{self.snapshot_date}.csv'
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        # Index alert messages by page once (ordered by severity, as self.alerts)
+        alerts_by_path = defaultdict(list)
+        for alert in self.alerts:
+            alerts_by_path[alert['page_path']].append(alert['message'])
+
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow([
                 'Rank', 'Page Path', 'Post Title', 'Full URL', 'Score',
@@ -384,34 +493,10 @@ class CoreArticleTracker:
                 'Last Modified', 'Days Since Update', 'Focus Keyword',
                 'Keyword Score', 'Readability', 'Is Cornerstone', 'Alerts'
             ])
-
-            for article in self.articles_data:
-                # Get alerts for this article
-                article_alerts = [a['message'] for a in self.alerts
-                                if a['page_path'] == article['page_path']]
-                alerts_str = '; '.join(article_alerts) if article_alerts else ''
-
-                writer.writerow([
-                    article['rank'],
-                    article['page_path'],
-                    article['post_title'],
-                    get_post_url(article['post_name']) if article['post_name'] else '',
-                    f"{article['score']:.2f}",
-                    article['pageviews'],
-                    article['sessions'],
-                    article['clicks'],
-                    article['impressions'],
-                    f"{article['position']:.1f}",
-                    f"{article['ctr']:.4f}",
-                    f"{article['avg_duration']:.1f}",
-                    article['last_modified'],
-                    article['days_since_update'],
-                    article['focus_keyword'] or '',
-                    article['keyword_score'],
-                    article['readability_score'],
-                    'Yes' if article['is_cornerstone'] else 'No',
-                    alerts_str
-                ])
+            writer.writerows(
+                self.csv_row(article, alerts_by_path.get(article.page_path, ()))
+                for article in self.articles_data
+            )
 
         print(f"\n✓ CSV report saved: {output_file}")
 
@@ -438,14 +523,22 @@ class CoreArticleTracker:
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='LinuxConfig.org - Enhanced Core Article Tracker')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore cached Google API results and fetch fresh data')
+    args = parser.parse_args()
+
+    if args.no_cache:
+        os.environ[NO_CACHE_ENV] = '1'
+
     tracker = CoreArticleTracker()
 
     try:
         # Start tracking
         tracker.start_run()
 
-        # Fetch Google data
-        ga_data, sc_data = tracker.fetch_google_data()
+        # Fetch Google data (and prefetch WordPress data for likely top 30)
+        ga_data, sc_data, wp_metadata = tracker.fetch_source_data(top_n=30)
 
         if not ga_data and not sc_data:
             print("\n❌ Failed to retrieve data from Google APIs")
@@ -453,16 +546,14 @@ def main():
             return
 
         # Combine and score
-        sorted_articles = tracker.combine_and_score(ga_data, sc_data)
+        sorted_articles = tracker.combine_and_score(ga_data, sc_data, top_n=30)
 
         # Enrich with WordPress data
-        tracker.enrich_with_wordpress_data(sorted_articles, top_n=30)
+        tracker.enrich_with_wordpress_data(sorted_articles, top_n=30, wp_metadata=wp_metadata)
 
-        # Generate alerts
-        tracker.generate_alerts()
-
-        # Save to database
+        # Save snapshot, then alert on it against the previous one
         tracker.save_snapshot()
+        tracker.generate_alerts()
         tracker.save_alerts()
 
         # Generate reports
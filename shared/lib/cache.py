@@ -0,0 +1,80 @@
+"""
+Disk cache utilities for LinuxConfig Toolkit
+Keeps slow external API results between script runs
+"""
+import hashlib
+import os
+import pickle
+import time
+from datetime import date, datetime
+from functools import wraps
+
+
+# Paths from environment or defaults
+CACHE_DIR = os.getenv('TOOLKIT_CACHE_DIR', '/app/cache')
+
+# Set (e.g. by --no-cache) to skip cached results and fetch fresh data
+NO_CACHE_ENV = 'TOOLKIT_NO_CACHE'
+
+
+def prune_cache(path, ttl_seconds):
+    """Remove cache entries and leftover temp files that can no longer be read"""
+    # Keys include the date, so anything written before today is dead too
+    midnight = datetime.combine(date.today(), datetime.min.time()).timestamp()
+    cutoff = max(time.time() - ttl_seconds, midnight)
+
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+
+    for entry in entries:
+        if not entry.name.endswith(('.pkl', '.tmp')):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def ttl_cache(ttl_seconds=43200, path=CACHE_DIR):
+    """
+    Cache a function's result on disk for ttl_seconds
+
+    Entries are keyed by function name, arguments and today's date, so they
+    never outlive the day they were fetched. Empty results are not cached.
+    Expired entries under path are removed whenever a new one is written.
+    With NO_CACHE_ENV set, cached entries are ignored but fresh results are
+    still stored.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = repr((func.__name__, args, sorted(kwargs.items()), date.today().isoformat()))
+            cache_file = os.path.join(path, hashlib.sha1(key.encode()).hexdigest() + '.pkl')
+
+            if not os.getenv(NO_CACHE_ENV):
+                try:
+                    if os.path.getmtime(cache_file) > time.time() - ttl_seconds:
+                        with open(cache_file, 'rb') as f:
+                            return pickle.load(f)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    pass
+
+            result = func(*args, **kwargs)
+
+            if result:
+                try:
+                    os.makedirs(path, exist_ok=True)
+                    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                    with open(tmp_file, 'wb') as f:
+                        pickle.dump(result, f)
+                    os.replace(tmp_file, cache_file)
+                except OSError:
+                    pass
+                prune_cache(path, ttl_seconds)
+
+            return result
+        return wrapper
+    return decorator
@@ -2,6 +2,7 @@
 Database connection utilities for LinuxConfig Toolkit
 Handles connections to both toolkit DB and WordPress staging DB
 """
+import atexit
 import os
 import MySQLdb
 from contextlib import contextmanager
@@ -9,27 +10,53 @@ from contextlib import contextmanager
 
 class DatabaseConnection:
     """Manages database connections"""
-    
-    @staticmethod
+
+    # Toolkit connection reused by every get_toolkit_connection() call
+    _toolkit_conn = None
+
+    @classmethod
     @contextmanager
-    def get_toolkit_connection():
-        """Get connection to toolkit database"""
-        conn = MySQLdb.connect(
-            host=os.getenv('TOOLKIT_DB_HOST', 'mariadb'),
-            port=int(os.getenv('TOOLKIT_DB_PORT', 3306)),
-            user=os.getenv('TOOLKIT_DB_USER', 'toolkit_user'),
-            passwd=os.getenv('TOOLKIT_DB_PASSWORD'),
-            db=os.getenv('TOOLKIT_DB_NAME', 'linuxconfig_toolkit'),
-            charset='utf8mb4'
-        )
+    def get_toolkit_connection(cls):
+        """
+        Get connection to toolkit database
+
+        The connection is opened once per process and reused; each context
+        commits on success and rolls back on error. Not for use across threads.
+        """
+        conn = cls._toolkit_conn
+        if conn is not None:
+            try:
+                conn.ping()
+            except MySQLdb.Error:
+                cls.close_toolkit_connection()
+                conn = None
+
+        if conn is None:
+            conn = cls._toolkit_conn = MySQLdb.connect(
+                host=os.getenv('TOOLKIT_DB_HOST', 'mariadb'),
+                port=int(os.getenv('TOOLKIT_DB_PORT', 3306)),
+                user=os.getenv('TOOLKIT_DB_USER', 'toolkit_user'),
+                passwd=os.getenv('TOOLKIT_DB_PASSWORD'),
+                db=os.getenv('TOOLKIT_DB_NAME', 'linuxconfig_toolkit'),
+                charset='utf8mb4'
+            )
+
         try:
             yield conn
             conn.commit()
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
-            conn.close()
+
+    @classmethod
+    def close_toolkit_connection(cls):
+        """Close the shared toolkit connection, if open"""
+        conn, cls._toolkit_conn = cls._toolkit_conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except MySQLdb.Error:
+                pass
     
     @staticmethod
     @contextmanager
@@ -49,27 +76,46 @@ class DatabaseConnection:
             conn.close()
 
 
+atexit.register(DatabaseConnection.close_toolkit_connection)
+
+
+@contextmanager
+def cursor_for(conn, cursor_class=None):
+    """Open a cursor on conn and make sure it is closed afterwards"""
+    cursor = conn.cursor(cursor_class) if cursor_class else conn.cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
 def execute_query(conn, query, params=None):
     """Execute a query and return results"""
-    cursor = conn.cursor(MySQLdb.cursors.DictCursor)
-    cursor.execute(query, params or ())
-    results = cursor.fetchall()
-    cursor.close()
-    return results
+    with cursor_for(conn, MySQLdb.cursors.DictCursor) as cursor:
+        cursor.execute(query, params or ())
+        return cursor.fetchall()
 
 
 def execute_insert(conn, query, params=None):
     """Execute an insert and return last insert ID"""
-    cursor = conn.cursor()
-    cursor.execute(query, params or ())
-    last_id = cursor.lastrowid
-    cursor.close()
-    return last_id
+    with cursor_for(conn) as cursor:
+        cursor.execute(query, params or ())
+        return cursor.lastrowid
 
 
 def execute_update(conn, query, params=None):
     """Execute an update and return affected rows"""
-    cursor = conn.cursor()
-    affected = cursor.execute(query, params or ())
-    cursor.close()
-    return affected
+    with cursor_for(conn) as cursor:
+        return cursor.execute(query, params or ())
+
+
+def execute_many(conn, query, seq_of_params):
+    """
+    Execute a statement once per params tuple and return affected rows
+
+    MySQLdb rewrites INSERT ... VALUES (...) statements into multi-row
+    INSERTs of up to cursor.max_stmt_length (64 KiB) each, so a batch costs
+    one round trip per ~64 KiB of SQL rather than one per row.
+    """
+    with cursor_for(conn) as cursor:
+        return cursor.executemany(query, seq_of_params)
@@ -3,7 +3,9 @@ Google Analytics and Search Console API utilities
 Handles authentication and data fetching
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -11,9 +13,12 @@ from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
     DateRange,
     Dimension,
+    Filter,
+    FilterExpression,
     Metric,
     RunReportRequest,
 )
+from shared.lib.cache import ttl_cache
 
 
 # Paths from environment or defaults
@@ -22,6 +27,28 @@ SC_TOKEN_PATH = os.getenv('SC_TOKEN_PATH', '/app/shared/config/credentials/token
 GA_PROPERTY_ID = os.getenv('GA_PROPERTY_ID', '354741599')
 SC_PROPERTY = os.getenv('SC_PROPERTY', 'https://linuxconfig.org/')
 
+# Non-article pages, excluded at the API level
+NON_ARTICLE_PATHS = ['/', '/index.html', '/about', '/contact']
+
+
+@lru_cache(maxsize=None)
+def get_analytics_client():
+    """Get the process-wide Google Analytics Data API client"""
+    credentials = service_account.Credentials.from_service_account_file(GA_KEY_FILE)
+    return BetaAnalyticsDataClient(credentials=credentials)
+
+
+@lru_cache(maxsize=None)
+def get_search_console_service():
+    """
+    Get the process-wide Search Console API service
+
+    The underlying httplib2 transport is not thread-safe; only use it from
+    one thread at a time.
+    """
+    creds = Credentials.from_authorized_user_file(SC_TOKEN_PATH)
+    return build('searchconsole', 'v1', credentials=creds)
+
 
 def get_date_range(days=90):
     """Get start and end dates for queries"""
@@ -30,6 +57,7 @@ def get_date_range(days=90):
     return start_date, end_date
 
 
+@ttl_cache(ttl_seconds=43200)
 def get_analytics_data(days=90, limit=100):
     """
     Fetch Google Analytics data
@@ -39,13 +67,22 @@ def get_analytics_data(days=90, limit=100):
     """
     start_date, end_date = get_date_range(days)
     
-    credentials = service_account.Credentials.from_service_account_file(GA_KEY_FILE)
-    client = BetaAnalyticsDataClient(credentials=credentials)
+    client = get_analytics_client()
     
     request = RunReportRequest(
         property=f"properties/{GA_PROPERTY_ID}",
         date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
         dimensions=[Dimension(name="pagePath")],
+        dimension_filter=FilterExpression(
+            not_expression=FilterExpression(
+                filter=Filter(
+                    field_name="pagePath",
+                    in_list_filter=Filter.InListFilter(
+                        values=NON_ARTICLE_PATHS, case_sensitive=True
+                    )
+                )
+            )
+        ),
         metrics=[
             Metric(name="screenPageViews"),
             Metric(name="sessions"),
@@ -64,19 +101,16 @@ def get_analytics_data(days=90, limit=100):
     
     ga_data = {}
     for row in response.rows:
-        page_path = row.dimension_values[0].value
-        
-        # Filter out non-article pages
-        if page_path not in ['/', '/index.html', '/about', '/contact']:
-            ga_data[page_path] = {
-                'pageviews': int(row.metric_values[0].value),
-                'sessions': int(row.metric_values[1].value),
-                'avg_duration': float(row.metric_values[2].value)
-            }
+        ga_data[row.dimension_values[0].value] = {
+            'pageviews': int(row.metric_values[0].value),
+            'sessions': int(row.metric_values[1].value),
+            'avg_duration': float(row.metric_values[2].value)
+        }
     
     return ga_data
 
 
+@ttl_cache(ttl_seconds=43200)
 def get_search_console_data(days=90, limit=100):
     """
     Fetch Search Console data
@@ -86,13 +120,22 @@ def get_search_console_data(days=90, limit=100):
     """
     start_date, end_date = get_date_range(days)
     
-    creds = Credentials.from_authorized_user_file(SC_TOKEN_PATH)
-    service = build('searchconsole', 'v1', credentials=creds)
+    service = get_search_console_service()
     
     request = {
         'startDate': start_date,
         'endDate': end_date,
         'dimensions': ['page'],
+        'dimensionFilterGroups': [{
+            'filters': [
+                {
+                    'dimension': 'page',
+                    'operator': 'notEquals',
+                    'expression': SC_PROPERTY.rstrip('/') + path
+                }
+                for path in NON_ARTICLE_PATHS
+            ]
+        }],
         'rowLimit': limit
     }
     
@@ -117,6 +160,19 @@ def get_search_console_data(days=90, limit=100):
     return sc_data
 
 
+def get_google_data(days=90, limit=100):
+    """
+    Fetch Google Analytics and Search Console data concurrently
+
+    Returns:
+        Tuple of (ga_data, sc_data) dicts as returned by the individual fetchers
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ga_future = executor.submit(get_analytics_data, days, limit)
+        sc_future = executor.submit(get_search_console_data, days, limit)
+        return ga_future.result(), sc_future.result()
+
+
 def calculate_composite_score(ga_metrics, sc_metrics):
     """
     Calculate composite score from GA and GSC metrics
@@ -4,8 +4,12 @@ Retrieves post metadata and Yoast SEO data
 """
 import os
 from datetime import datetime
+from functools import lru_cache
 from shared.lib.db import DatabaseConnection, execute_query
 
+# Maximum post names per IN (...) lookup
+POST_NAME_BATCH_SIZE = 1000
+
 
 def get_post_metadata(post_names=None):
     """
@@ -18,15 +22,7 @@ def get_post_metadata(post_names=None):
         Dict mapping post_name to metadata dict
     """
     table_prefix = os.getenv('WP_TABLE_PREFIX', 'wp_')
-    
-    where_clause = ""
-    params = ()
-    
-    if post_names:
-        placeholders = ','.join(['%s'] * len(post_names))
-        where_clause = f"AND p.post_name IN ({placeholders})"
-        params = tuple(post_names)
-    
+
     query = f"""
         SELECT 
             p.ID as post_id,
@@ -44,12 +40,21 @@ def get_post_metadata(post_names=None):
             ON p.ID = y.object_id AND y.object_type = 'post'
         WHERE p.post_type = 'post' 
             AND p.post_status = 'publish'
-            {where_clause}
     """
-    
+
+    results = []
     with DatabaseConnection.get_wordpress_connection() as conn:
-        results = execute_query(conn, query, params)
-    
+        if post_names is None:
+            results.extend(execute_query(conn, query))
+        else:
+            # One IN (...) query per batch of names
+            post_names = list(dict.fromkeys(post_names))
+            for start in range(0, len(post_names), POST_NAME_BATCH_SIZE):
+                batch = post_names[start:start + POST_NAME_BATCH_SIZE]
+                placeholders = ','.join(['%s'] * len(batch))
+                batch_query = query + f"AND p.post_name IN ({placeholders})"
+                results.extend(execute_query(conn, batch_query, tuple(batch)))
+
     # Convert to dict keyed by post_name
     metadata = {}
     for row in results:
@@ -68,6 +73,7 @@ def get_post_metadata(post_names=None):
     return metadata
 
 
+@lru_cache(maxsize=None)
 def extract_post_name_from_path(page_path):
     """
     Extract post_name from GA/GSC page path
@@ -76,7 +82,7 @@ def extract_post_name_from_path(page_path):
         '/linux-commands/' -> 'linux-commands'
         '/how-to-install-ubuntu/' -> 'how-to-install-ubuntu'
     """
-    return page_path.strip('/').split('/')[-1]
+    return page_path.rstrip('/').rpartition('/')[2]
 
 
 def get_post_url(post_name):